@@ -1,8 +1,14 @@
 """Configuration module for application settings."""
 
+import functools
 import subprocess
+from importlib.resources.abc import Traversable
+from pathlib import Path
+from typing import Any, Literal
 
+import yaml
 from pydantic import BaseModel, Field, field_validator
+from pydantic.fields import FieldInfo
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
@@ -10,12 +16,149 @@ from pydantic_settings import (
     YamlConfigSettingsSource,
 )
 
-from .environment import app_environment
+from .environment import _ENV_FILE, get_app_environment
+
+# Use the libyaml C loader when available; it parses several times faster
+# than PyYAML's pure-Python SafeLoader and produces identical results.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML files keyed by (path, mtime), shared process-wide so repeated
+# settings constructions stat the file instead of re-reading and re-parsing it.
+_YAML_CACHE: dict[tuple[str, int], dict[str, Any]] = {}
+
+
+class FastYamlConfigSettingsSource(YamlConfigSettingsSource):
+    """``YamlConfigSettingsSource`` that parses with the libyaml C loader.
+
+    Parsed contents are cached by ``(path, mtime)``; consumers must treat the
+    returned mapping as read-only.
+    """
+
+    def _read_file(self, file_path: Path | Traversable) -> dict[str, Any]:
+        if not isinstance(file_path, Path):
+            # Traversable inputs (e.g. importlib.resources entries) have no
+            # stat()/mtime to key the cache on; read and parse them directly.
+            with file_path.open(encoding=self.yaml_file_encoding) as yaml_file:
+                return yaml.load(yaml_file, Loader=_YAML_LOADER) or {}
+
+        key = (str(file_path), file_path.stat().st_mtime_ns)
+        cached = _YAML_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        with file_path.open(encoding=self.yaml_file_encoding) as yaml_file:
+            data = yaml.load(yaml_file, Loader=_YAML_LOADER) or {}
+        _YAML_CACHE[key] = data
+        return data
+
+
+class LazyYamlSettingsSource(PydanticBaseSettingsSource):
+    """YAML settings source that defers reading the file until values are needed.
+
+    The stock ``YamlConfigSettingsSource`` opens and parses its file as soon as
+    it is constructed. This wrapper only builds the real source on first call,
+    and skips the open/parse entirely when the file does not exist.
+    """
+
+    def __init__(self, settings_cls: type[BaseSettings], yaml_file: Path):
+        super().__init__(settings_cls)
+        self._yaml_file = yaml_file
+        self._source: FastYamlConfigSettingsSource | None = None
+
+    def get_field_value(
+        self, field: FieldInfo, field_name: str
+    ) -> tuple[Any, str, bool]:
+        # Values are resolved through __call__; nothing to do per field.
+        return None, "", False
+
+    def __call__(self) -> dict[str, Any]:
+        if self._source is None:
+            if not self._yaml_file.is_file():
+                return {}
+            self._source = FastYamlConfigSettingsSource(
+                self.settings_cls, self._yaml_file
+            )
+        return self._source()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(yaml_file={self._yaml_file})"
+
+
+def _read_git_head(root: Path) -> str | None:
+    """Read the current commit hash straight from ``.git``, without git.
+
+    Handles a detached HEAD, a branch ref under ``.git/refs``, and packed
+    refs. Returns None when the hash cannot be determined this way (e.g.
+    not a plain git checkout), in which case the caller falls back to a
+    ``git rev-parse`` subprocess.
+    """
+    git_dir = root / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+    if not head.startswith("ref: "):
+        # Detached HEAD: the file holds the commit hash itself.
+        return head or None
+
+    ref = head.removeprefix("ref: ").strip()
+    try:
+        return (git_dir / ref).read_text(encoding="utf-8").strip() or None
+    except OSError:
+        pass
+
+    try:
+        packed = (git_dir / "packed-refs").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    for line in packed.splitlines():
+        if line.startswith(("#", "^")):
+            continue
+        commit, _, name = line.partition(" ")
+        if name.strip() == ref:
+            return commit
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_git_commit(root: str) -> str:
+    """Resolve the current git commit hash for the given repository root.
+
+    Prefers reading ``.git`` directly, which costs two small file reads
+    instead of a fork/exec and also works where git is not installed. The
+    result is cached for the process lifetime, so repeated settings
+    instantiations resolve the commit at most once.
+    """
+    commit = _read_git_head(Path(root))
+    if commit is not None:
+        return commit
+
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=5,
+            cwd=root,
+        )
+        return result.stdout.strip()
+    except (
+        subprocess.CalledProcessError,
+        FileNotFoundError,
+        subprocess.TimeoutExpired,
+    ):
+        return "unknown"
 
 
 class RollbarSettings(BaseModel):
     access_token: str = Field(description="Rollbar access token")
     code_version: str = Field(default="")
+    min_enrich_level: Literal["debug", "info", "warning", "error", "critical"] = Field(
+        default="error",
+        description="Lowest event level that receives payload enrichment",
+    )
 
     @field_validator("code_version", mode="before")
     @classmethod
@@ -24,31 +167,17 @@ class RollbarSettings(BaseModel):
         if value:
             return value
 
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=5,
-                cwd=app_environment.root_path,
-            )
-            return result.stdout.strip()
-        except (
-            subprocess.CalledProcessError,
-            FileNotFoundError,
-            subprocess.TimeoutExpired,
-        ):
-            return "unknown"
+        return _resolve_git_commit(str(get_app_environment().root_path))
 
 
 class ApplicationSettings(BaseSettings):
     model_config = SettingsConfigDict(
-        env_file=str(app_environment.from_root(".env")),
+        env_file=str(_ENV_FILE),
         env_file_encoding="utf-8",
         env_nested_delimiter="__",
         case_sensitive=False,
         extra="ignore",
+        defer_build=True,
     )
 
     rollbar: RollbarSettings = Field(description="Rollbar settings")
@@ -62,14 +191,15 @@ class ApplicationSettings(BaseSettings):
         dotenv_settings: PydanticBaseSettingsSource,
         file_secret_settings: PydanticBaseSettingsSource,
     ) -> tuple[PydanticBaseSettingsSource, ...]:
+        app_environment = get_app_environment()
         return (
             env_settings,
             dotenv_settings,
-            YamlConfigSettingsSource(
+            LazyYamlSettingsSource(
                 settings_cls,
                 app_environment.from_root(f"settings.{app_environment.name}.yaml"),
             ),
-            YamlConfigSettingsSource(
+            LazyYamlSettingsSource(
                 settings_cls,
                 app_environment.from_root("settings.yaml"),
             ),
@@ -77,4 +207,14 @@ class ApplicationSettings(BaseSettings):
         )
 
 
-app_settings = ApplicationSettings()
+@functools.lru_cache(maxsize=1)
+def get_app_settings() -> ApplicationSettings:
+    """Return the process-wide settings, constructing them on first use."""
+    return ApplicationSettings()
+
+
+def __getattr__(name: str) -> ApplicationSettings:
+    """Lazily expose ``app_settings`` so importing this module stays cheap."""
+    if name == "app_settings":
+        return get_app_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
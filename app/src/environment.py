@@ -1,5 +1,6 @@
 """Configuration module for application settings."""
 
+import functools
 from pathlib import Path
 
 from pydantic import Field
@@ -15,6 +16,7 @@ class ApplicationEnvironment(BaseSettings):
         env_file_encoding="utf-8",
         extra="ignore",
         cli_parse_args=True,
+        defer_build=True,
     )
 
     name: str = Field(default="local", validation_alias="ENVIRONMENT")
@@ -27,5 +29,16 @@ class ApplicationEnvironment(BaseSettings):
         return _APP_ROOT / relative_path
 
 
-app_environment = ApplicationEnvironment()
-print(f"ENVIRONMENT={app_environment.name}")
+@functools.lru_cache(maxsize=1)
+def get_app_environment() -> ApplicationEnvironment:
+    """Return the process-wide environment, constructing it on first use."""
+    environment = ApplicationEnvironment()
+    print(f"ENVIRONMENT={environment.name}")
+    return environment
+
+
+def __getattr__(name: str) -> ApplicationEnvironment:
+    """Lazily expose ``app_environment`` so importing this module stays cheap."""
+    if name == "app_environment":
+        return get_app_environment()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
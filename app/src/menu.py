@@ -1,44 +1,77 @@
 """Menu system for the Rollbar demo application."""
 
+import functools
 import sys
+from typing import TYPE_CHECKING
 
-from .scenarios import ALL_SCENARIOS, BaseScenario
+from .scenarios import SCENARIO_SPECS, ScenarioSpec, get_scenario
 from .utils import clear_screen, print_header
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class Menu:
     """Main menu class that manages scenario selection and execution"""
 
-    def __init__(self, scenarios: list[BaseScenario]):
-        """Initialize the menu with a list of scenarios.
+    def __init__(self, scenarios: tuple[ScenarioSpec, ...]):
+        """Initialize the menu with scenario metadata.
 
         Args:
-            scenarios: List of BaseScenario instances to display in the menu.
+            scenarios: ScenarioSpec entries to display in the menu. The
+                scenario instances themselves are loaded on first run.
         """
         self.scenarios = scenarios
+        # The menu text never changes, so render it once and emit it with a
+        # single write per redraw instead of a dozen print calls.
+        lines = ["\nAvailable Demos:", "-" * 60]
+        lines.extend(
+            f"{idx}. {scenario.name} - {scenario.description}"
+            for idx, scenario in enumerate(scenarios, start=1)
+        )
+        lines.extend(("0. Exit", "-" * 60))
+        self._rendered = "\n".join(lines) + "\n"
+        # Choice handlers keyed by menu number, built once up front from the
+        # same specs the menu text is rendered from.
+        self._dispatch: dict[int, Callable[[], bool]] = {
+            idx: functools.partial(self._run_scenario, spec)
+            for idx, spec in enumerate(scenarios, start=1)
+        }
+        self._dispatch[0] = self._exit
 
     def display(self) -> None:
         """Display the menu options."""
-        print("\nAvailable Demos:")
-        print("-" * 60)
-
-        for idx, scenario in enumerate(self.scenarios, start=1):
-            print(f"{idx}. {scenario.name} - {scenario.description}")
-
-        print("0. Exit")
-        print("-" * 60)
+        sys.stdout.write(self._rendered)
 
     def get_user_choice(self) -> int:
         """Get and validate user's menu choice.
 
+        Reads stdin directly instead of going through input(), which would
+        initialize readline even for piped/scripted runs.
+
         Returns:
-            The user's choice as an integer.
+            The user's choice as an integer; 0 (exit) on end of input.
         """
-        try:
-            choice = input("\nSelect a demo (0-8): ").strip()
-            return int(choice)
-        except ValueError:
-            return -1
+        sys.stdout.write("\nSelect a demo (0-8): ")
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            return 0
+        choice = line.strip()
+        return int(choice) if choice.isdigit() else -1
+
+    @staticmethod
+    def _run_scenario(spec: ScenarioSpec) -> bool:
+        """Run the scenario described by ``spec`` and keep the loop going."""
+        get_scenario(spec).run()
+        return True
+
+    @staticmethod
+    def _exit() -> bool:
+        """Print the farewell message and stop the menu loop."""
+        print("\nExiting demo. Check your Rollbar dashboard to see all the data!")
+        print("You can search, filter, and analyze all the errors sent.\n")
+        return False
 
     def handle_choice(self, choice: int) -> bool:
         """Handle the selected item.
@@ -49,20 +82,12 @@ class Menu:
         Returns:
             True to continue, False to exit.
         """
-        if choice == 0:
-            print("\nExiting demo. Check your Rollbar dashboard to see all the data!")
-            print("You can search, filter, and analyze all the errors sent.\n")
-            return False
-
-        num_scenarios = len(self.scenarios)
-        if 1 <= choice <= num_scenarios:
-            scenario = self.scenarios[choice - 1]
-            scenario.run()
+        handler = self._dispatch.get(choice)
+        if handler is None:
+            print(f"\nInvalid choice. Please select 0-{len(self.scenarios)}.")
+            input("Press Enter to continue...")
             return True
-
-        print(f"\nInvalid choice. Please select 0-{num_scenarios}.")
-        input("Press Enter to continue...")
-        return True
+        return handler()
 
     def run(self) -> None:
         """Run the main menu loop."""
@@ -84,4 +109,4 @@ def create_menu() -> Menu:
     Returns:
         A configured Menu instance.
     """
-    return Menu(ALL_SCENARIOS)
+    return Menu(SCENARIO_SPECS)
@@ -3,12 +3,21 @@ Module providing a small wrapper around the Rollbar Python SDK to initialize
 Rollbar and enrich outgoing error payloads with application-specific context.
 """
 
+import logging
+import os
+from typing import TYPE_CHECKING, cast
+
 import msgspec
 
 import rollbar
 
-from .config import app_settings
-from .environment import app_environment
+from .config import get_app_settings
+from .environment import get_app_environment
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
 
 
 class CustomMetadata(msgspec.Struct):
@@ -18,15 +27,64 @@ class CustomMetadata(msgspec.Struct):
     simple_value: str
 
 
+# Constant payload enrichment, built once per process. Only the per-event
+# trace id is generated inside the handler; everything else is shared by
+# reference, so handlers further down the chain must not mutate it.
+_FRAMEWORK = "oreore_framework 1.0"
+_FEATURE_FLAGS = ("feature_1", "feature_2")
+# Level names in severity order; events below the configured minimum skip
+# enrichment entirely. The threshold is resolved once in setup_rollbar().
+_LEVEL_ORDINAL = {"debug": 0, "info": 1, "warning": 2, "error": 3, "critical": 4}
+_min_enrich_ordinal = _LEVEL_ORDINAL["error"]
+_BASE_MODEL_CUSTOM = msgspec.to_builtins(
+    {
+        "the_model": CustomMetadata(
+            empty_value=None,
+            dict_value={"key1": 10, "key2": 20},
+            list_value=[1, 2, 3],
+            simple_value="foo_value",
+        )
+    },
+)
+
+
 def setup_rollbar() -> None:
     """Initialize Rollbar with application settings."""
+    global _min_enrich_ordinal
+    app_settings = get_app_settings()
+    _min_enrich_ordinal = _LEVEL_ORDINAL[app_settings.rollbar.min_enrich_level]
     print(f"Rollbar access token: {app_settings.rollbar.access_token}")
     rollbar.init(
         access_token=app_settings.rollbar.access_token,
-        environment=app_environment.name,
+        environment=get_app_environment().name,
         code_version=app_settings.rollbar.code_version,
+        # Post items from a worker pool so scenario loops that report many
+        # events enqueue and return instead of serializing on the network.
+        handler="thread_pool",
+        thread_pool_workers=8,
     )
     rollbar.events.add_payload_handler(_payload_handler)
+    rollbar._serialize_payload = _fast_serialize
+
+
+# The SDK serializer the fallback path delegates to; bound at import so the
+# swap in setup_rollbar() cannot recurse into itself. The SDK module is
+# untyped, so pin down the signature here.
+_sdk_serialize = cast("Callable[[dict], str]", rollbar._serialize_payload)
+
+
+def _fast_serialize(payload: dict) -> str:
+    """Serialize a payload with msgspec, falling back to the SDK encoder.
+
+    The SDK serializes every item with ``json.dumps`` plus a custom default
+    hook; msgspec encodes the same builtins-only payloads several times
+    faster. Payloads the SDK's transforms have already reduced to builtins
+    encode directly; anything exotic falls back to the stock serializer.
+    """
+    try:
+        return msgspec.json.encode(payload).decode()
+    except (msgspec.EncodeError, TypeError):
+        return _sdk_serialize(payload)
 
 
 def _payload_handler(payload: dict, **_kw: object) -> dict | bool:
@@ -39,20 +97,26 @@ def _payload_handler(payload: dict, **_kw: object) -> dict | bool:
     Returns:
         The modified payload dictionary with added person and custom data.
     """
-    level = payload["data"]["level"]
-    print(f"Processing {level} level event")
-
-    payload["data"]["framework"] = "oreore_framework 1.0"
-
-    payload["data"]["base_model_custom"] = msgspec.to_builtins(
-        {
-            "the_model": CustomMetadata(
-                empty_value=None,
-                dict_value={"key1": 10, "key2": 20},
-                list_value=[1, 2, 3],
-                simple_value="foo_value",
-            )
-        },
-    )
+    data = payload["data"]
+    level = data["level"]
+    if _LEVEL_ORDINAL.get(level, 0) < _min_enrich_ordinal:
+        return payload
+
+    # %s-style args keep the formatting lazy: nothing is built unless DEBUG
+    # logging is actually enabled.
+    logger.debug("Processing %s level event", level)
+
+    data["framework"] = _FRAMEWORK
+
+    custom = {
+        "trace_id": os.urandom(16).hex(),
+        "feature_flags": _FEATURE_FLAGS,
+    }
+    existing_custom = data.get("custom")
+    if existing_custom:
+        custom.update(existing_custom)
+    data["custom"] = custom
+
+    data["base_model_custom"] = _BASE_MODEL_CUSTOM
 
     return payload
@@ -2,32 +2,118 @@
 
 This module contains all available demo scenarios.
 Each scenario demonstrates a specific feature of the Rollbar SDK.
+
+Scenario modules pull in the Rollbar SDK, so they are loaded lazily: only
+the name/description metadata below is available at import time, and a
+scenario module is imported and its class instantiated on first use.
 """
 
+import importlib
+from typing import NamedTuple
+
 from .base import BaseScenario
-from .business_events import BusinessEventsScenario
-from .custom_data import CustomDataScenario
-from .error_levels import ErrorLevelsScenario
-from .exception_types import ExceptionTypesScenario
-from .exception_vs_message import ExceptionVsMessageScenario
-from .multiple_errors import MultipleErrorsScenario
-from .person_tracking import PersonTrackingScenario
-from .searchable_fields import SearchableFieldsScenario
-
-# List of all available scenarios in display order
-ALL_SCENARIOS = [
-    PersonTrackingScenario(),
-    CustomDataScenario(),
-    ErrorLevelsScenario(),
-    ExceptionVsMessageScenario(),
-    SearchableFieldsScenario(),
-    MultipleErrorsScenario(),
-    ExceptionTypesScenario(),
-    BusinessEventsScenario(),
-]
+
+
+class ScenarioSpec(NamedTuple):
+    """Static scenario metadata plus the lazy import location of its class."""
+
+    name: str
+    description: str
+    module: str
+    class_name: str
+
+
+# All available scenarios in display order.
+SCENARIO_SPECS: tuple[ScenarioSpec, ...] = (
+    ScenarioSpec(
+        "Person Tracking",
+        "Associate errors with different users",
+        ".person_tracking",
+        "PersonTrackingScenario",
+    ),
+    ScenarioSpec(
+        "Custom Data",
+        "Attach metadata to error reports",
+        ".custom_data",
+        "CustomDataScenario",
+    ),
+    ScenarioSpec(
+        "Error Levels",
+        "Demonstrate all severity levels",
+        ".error_levels",
+        "ErrorLevelsScenario",
+    ),
+    ScenarioSpec(
+        "Exception vs Message",
+        "Compare reporting methods",
+        ".exception_vs_message",
+        "ExceptionVsMessageScenario",
+    ),
+    ScenarioSpec(
+        "Searchable Fields",
+        "Use context and custom fields",
+        ".searchable_fields",
+        "SearchableFieldsScenario",
+    ),
+    ScenarioSpec(
+        "Multiple Errors",
+        "Send a sequence of related errors",
+        ".multiple_errors",
+        "MultipleErrorsScenario",
+    ),
+    ScenarioSpec(
+        "Exception Types",
+        "Various Python exceptions",
+        ".exception_types",
+        "ExceptionTypesScenario",
+    ),
+    ScenarioSpec(
+        "Business Events",
+        "Track important application events",
+        ".business_events",
+        "BusinessEventsScenario",
+    ),
+)
+
+_CLASS_TO_SPEC = {spec.class_name: spec for spec in SCENARIO_SPECS}
+
+_instances: dict[ScenarioSpec, BaseScenario] = {}
+
+
+def get_scenario(spec: ScenarioSpec) -> BaseScenario:
+    """Return the scenario instance described by ``spec``.
+
+    The scenario module is imported and the class instantiated on first
+    request; the instance is cached for subsequent calls.
+    """
+    scenario = _instances.get(spec)
+    if scenario is None:
+        module = importlib.import_module(spec.module, __name__)
+        scenario = getattr(module, spec.class_name)()
+        _instances[spec] = scenario
+    return scenario
+
+
+def __getattr__(name: str) -> object:
+    """Lazily resolve scenario classes and ``ALL_SCENARIOS``.
+
+    Keeps the historical re-exports working without importing every
+    scenario module (and the Rollbar SDK) at package import time.
+    """
+    if name == "ALL_SCENARIOS":
+        return [get_scenario(spec) for spec in SCENARIO_SPECS]
+    spec = _CLASS_TO_SPEC.get(name)
+    if spec is not None:
+        module = importlib.import_module(spec.module, __name__)
+        return getattr(module, spec.class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BaseScenario",
+    "ScenarioSpec",
+    "SCENARIO_SPECS",
+    "get_scenario",
     "PersonTrackingScenario",
     "CustomDataScenario",
     "ErrorLevelsScenario",
@@ -1,25 +1,36 @@
 """Base class for all Rollbar demo scenarios."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, TypeVar
+
+_T = TypeVar("_T")
 
 
 class BaseScenario(ABC):
     """Abstract base class for demo scenarios.
 
-    Each scenario must implement the name, description, and run methods.
+    Each scenario must set the name and description class attributes and
+    implement the run method.
     """
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Return the display name of the scenario."""
-        pass
+    name: ClassVar[str]
+    """Display name of the scenario."""
 
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Return a brief description of what this scenario demonstrates."""
-        pass
+    description: ClassVar[str]
+    """Brief description of what this scenario demonstrates."""
+
+    @staticmethod
+    def _report_all(fn: Callable[[_T], object], items: Iterable[_T]) -> None:
+        """Apply ``fn`` to every item on a thread pool and wait for all.
+
+        Rollbar reporting is network-bound, so fanning independent per-item
+        calls out over threads overlaps the HTTP round-trips instead of
+        paying for them back to back.
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(fn, items))
 
     @abstractmethod
     def run(self) -> None:
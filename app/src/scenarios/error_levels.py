@@ -1,40 +1,48 @@
 """Error levels demonstration scenario."""
 
+import msgspec
+
 import rollbar
 
 from ..utils import wait_for_user
 from .base import BaseScenario
 
 
+class LevelMessage(msgspec.Struct, frozen=True):
+    """A demo message reported at a specific severity level."""
+
+    level: str
+    message: str
+
+
+# One message per severity level, built once at import.
+_LEVELS: tuple[LevelMessage, ...] = (
+    LevelMessage("debug", "Debug: Variable value = 42"),
+    LevelMessage("info", "Info: User logged in successfully"),
+    LevelMessage("warning", "Warning: Disk space running low (15% remaining)"),
+    LevelMessage("error", "Error: Failed to connect to external API"),
+    LevelMessage("critical", "Critical: Database connection lost"),
+)
+
+
 class ErrorLevelsScenario(BaseScenario):
     """Demonstrate all five error severity levels."""
 
-    @property
-    def name(self) -> str:
-        """Return the display name of the scenario."""
-        return "Error Levels"
-
-    @property
-    def description(self) -> str:
-        """Return a brief description of what this scenario demonstrates."""
-        return "Demonstrate all severity levels"
+    name = "Error Levels"
+    description = "Demonstrate all severity levels"
 
     def run(self) -> None:
         """Execute the error levels demo."""
         print("\n>> DEMO: Error Levels")
         print("Sending messages at all severity levels...\n")
 
-        levels = [
-            ("debug", "Debug: Variable value = 42"),
-            ("info", "Info: User logged in successfully"),
-            ("warning", "Warning: Disk space running low (15% remaining)"),
-            ("error", "Error: Failed to connect to external API"),
-            ("critical", "Critical: Database connection lost"),
-        ]
-
-        for level, message in levels:
-            print(f"  - {level.upper():8} | {message}")
-            rollbar.report_message(message, level=level)
+        for entry in _LEVELS:
+            print(f"  - {entry.level.upper():8} | {entry.message}")
+
+        self._report_all(
+            lambda entry: rollbar.report_message(entry.message, level=entry.level),
+            _LEVELS,
+        )
 
         print("\nNote: You can filter by level in Rollbar dashboard.")
         print("Levels help prioritize which issues to address first.")
@@ -1,5 +1,6 @@
 """Different exception types demonstration scenario."""
 
+import sys
 from datetime import datetime
 
 import rollbar
@@ -11,15 +12,8 @@ from .base import BaseScenario
 class ExceptionTypesScenario(BaseScenario):
     """Demonstrate different Python exception types."""
 
-    @property
-    def name(self) -> str:
-        """Return the display name of the scenario."""
-        return "Exception Types"
-
-    @property
-    def description(self) -> str:
-        """Return a brief description of what this scenario demonstrates."""
-        return "Various Python exceptions"
+    name = "Exception Types"
+    description = "Various Python exceptions"
 
     def run(self) -> None:
         """Execute the exception types demo."""
@@ -34,17 +28,29 @@ class ExceptionTypesScenario(BaseScenario):
             ("ValueError", lambda: int("not_a_number")),
         ]
 
+        # One timestamp covers the whole batch; reading the clock inside the
+        # loop adds nothing at the resolution this demo cares about.
+        batch_timestamp = datetime.now().isoformat()
+
+        captured = []
         for exc_name, trigger in exceptions:
             try:
                 print(f"  - Triggering {exc_name}...")
                 trigger()
             except Exception:
-                rollbar.report_exc_info(
-                    extra_data={
-                        "exception_demo": exc_name,
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                )
+                captured.append((sys.exc_info(), exc_name))
+
+        def report(item: tuple[tuple, str]) -> None:
+            exc_info, exc_name = item
+            rollbar.report_exc_info(
+                exc_info,
+                extra_data={
+                    "exception_demo": exc_name,
+                    "timestamp": batch_timestamp,
+                },
+            )
+
+        self._report_all(report, captured)
 
         print("\nNote: Each exception type is captured with full stack trace.")
         print("Rollbar groups similar exceptions together automatically.")
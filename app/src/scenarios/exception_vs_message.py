@@ -5,19 +5,20 @@ import rollbar
 from ..utils import wait_for_user
 from .base import BaseScenario
 
+# Constant extra data for the two reports; built once and treated as
+# read-only.
+_INVALID_OPERATION_DATA = {
+    "operation": "delete_admin_account",
+    "reason": "insufficient_permissions",
+}
+_DIVISION_DATA = {"operation": "calculate_average", "denominator": 0}
+
 
 class ExceptionVsMessageScenario(BaseScenario):
     """Compare exception reporting vs message reporting."""
 
-    @property
-    def name(self) -> str:
-        """Return the display name of the scenario."""
-        return "Exception vs Message"
-
-    @property
-    def description(self) -> str:
-        """Return a brief description of what this scenario demonstrates."""
-        return "Compare reporting methods"
+    name = "Exception vs Message"
+    description = "Compare reporting methods"
 
     def run(self) -> None:
         """Execute the exception vs message demo."""
@@ -32,10 +33,7 @@ class ExceptionVsMessageScenario(BaseScenario):
         rollbar.report_message(
             "User attempted invalid operation",
             level="warning",
-            extra_data={
-                "operation": "delete_admin_account",
-                "reason": "insufficient_permissions",
-            },
+            extra_data=_INVALID_OPERATION_DATA,
         )
 
         # Second: Exception reporting
@@ -48,9 +46,7 @@ class ExceptionVsMessageScenario(BaseScenario):
             # Simulate a division by zero error
             _ = 100 / 0
         except ZeroDivisionError:
-            rollbar.report_exc_info(
-                extra_data={"operation": "calculate_average", "denominator": 0}
-            )
+            rollbar.report_exc_info(extra_data=_DIVISION_DATA)
 
         print("Note: Check Rollbar to see the difference:")
         print("  - Message reports show up as log entries")
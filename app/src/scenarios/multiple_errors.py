@@ -5,19 +5,27 @@ import rollbar
 from ..utils import wait_for_user
 from .base import BaseScenario
 
+# Constant extra data for each step of the failure cascade; built once and
+# treated as read-only.
+_LATENCY_DATA = {
+    "latency_ms": 2500,
+    "threshold_ms": 1000,
+    "db_host": "db-primary.example.com",
+}
+_TIMEOUT_DATA = {"query": "SELECT * FROM large_table", "timeout_seconds": 5}
+_DEGRADATION_DATA = {
+    "service": "api_server",
+    "response_time_ms": 8000,
+    "error_rate": 0.15,
+}
+_CIRCUIT_BREAKER_DATA = {"failures": 5, "threshold": 3, "timeout_seconds": 60}
+
 
 class MultipleErrorsScenario(BaseScenario):
     """Send multiple related errors to demonstrate grouping."""
 
-    @property
-    def name(self) -> str:
-        """Return the display name of the scenario."""
-        return "Multiple Errors"
-
-    @property
-    def description(self) -> str:
-        """Return a brief description of what this scenario demonstrates."""
-        return "Send a sequence of related errors"
+    name = "Multiple Errors"
+    description = "Send a sequence of related errors"
 
     def run(self) -> None:
         """Execute the multiple errors demo."""
@@ -31,11 +39,7 @@ class MultipleErrorsScenario(BaseScenario):
         rollbar.report_message(
             "Database connection latency detected",
             level="warning",
-            extra_data={
-                "latency_ms": 2500,
-                "threshold_ms": 1000,
-                "db_host": "db-primary.example.com",
-            },
+            extra_data=_LATENCY_DATA,
         )
 
         # Error 2: Query timeout
@@ -44,20 +48,14 @@ class MultipleErrorsScenario(BaseScenario):
             # Simulate a timeout error
             raise TimeoutError("Query exceeded 5 second timeout")
         except TimeoutError:
-            rollbar.report_exc_info(
-                extra_data={"query": "SELECT * FROM large_table", "timeout_seconds": 5}
-            )
+            rollbar.report_exc_info(extra_data=_TIMEOUT_DATA)
 
         # Error 3: Service degradation
         print("  3. Service degradation warning")
         rollbar.report_message(
             "Service performance degraded",
             level="error",
-            extra_data={
-                "service": "api_server",
-                "response_time_ms": 8000,
-                "error_rate": 0.15,
-            },
+            extra_data=_DEGRADATION_DATA,
         )
 
         # Error 4: Circuit breaker triggered
@@ -65,7 +63,7 @@ class MultipleErrorsScenario(BaseScenario):
         rollbar.report_message(
             "Circuit breaker opened for database",
             level="critical",
-            extra_data={"failures": 5, "threshold": 3, "timeout_seconds": 60},
+            extra_data=_CIRCUIT_BREAKER_DATA,
         )
 
         print("\nNote: These errors will appear in Rollbar with timestamps.")
@@ -1,11 +1,85 @@
 """Utility functions for the Rollbar demo application."""
 
-import os
+import functools
+import logging
+import queue
+import sys
+import threading
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# ANSI "clear screen" + "cursor home" - what the external clear/cls command
+# boils down to, without the fork/exec and terminfo lookup. Pre-encoded so
+# each clear is one buffer write with no text-codec pass.
+_CLEAR_BYTES = b"\x1b[2J\x1b[H"
+
+# Prompt emitted by wait_for_user, pre-encoded so the hot path is a single
+# buffer write with no text-codec pass.
+_CONTINUE_PROMPT = b"\nPress Enter to continue..."
+
+if sys.platform == "win32":  # pragma: no cover - Windows consoles only
+    # Enable virtual terminal processing once so the ANSI sequence works on
+    # modern Windows consoles (0x0004 = ENABLE_VIRTUAL_TERMINAL_PROCESSING).
+    import ctypes
+
+    _kernel32 = ctypes.windll.kernel32
+    _handle = _kernel32.GetStdHandle(-11)
+    _mode = ctypes.c_uint32()
+    if _kernel32.GetConsoleMode(_handle, ctypes.byref(_mode)):
+        _kernel32.SetConsoleMode(_handle, _mode.value | 0x0004)
+
+
+class ReportWorker:
+    """Background worker that runs submission jobs off the main thread.
+
+    Jobs go onto a queue and are executed by a single daemon thread, so
+    callers enqueue and keep running while the network I/O happens.
+    ``flush`` blocks until everything submitted so far has completed,
+    giving callers an explicit submission/completion split.
+    """
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[Callable[[], object]] = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._drain, name="report-worker", daemon=True
+        )
+        self._thread.start()
+
+    def _drain(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                job()
+            except Exception:
+                logger.exception("Background report job failed")
+            finally:
+                self._queue.task_done()
+
+    def submit(self, job: Callable[[], object]) -> None:
+        """Queue a job for execution on the worker thread."""
+        self._queue.put(job)
+
+    def flush(self) -> None:
+        """Block until every job submitted so far has finished."""
+        self._queue.join()
+
+
+@functools.lru_cache(maxsize=1)
+def get_report_worker() -> ReportWorker:
+    """Return the process-wide background report worker."""
+    return ReportWorker()
 
 
 def clear_screen():
-    """Clear the console screen."""
-    os.system("cls" if os.name == "nt" else "clear")
+    """Clear the console screen with an ANSI escape, without a subprocess.
+
+    Platform setup happens once at module import; each call is a single
+    write of the pre-encoded escape bytes.
+    """
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_CLEAR_BYTES)
+    sys.stdout.buffer.flush()
 
 
 def print_header():
@@ -17,5 +91,13 @@ def print_header():
 
 
 def wait_for_user():
-    """Wait for user to press Enter to continue."""
-    input("\nPress Enter to continue...")
+    """Wait for user to press Enter to continue.
+
+    Writes the prompt and reads stdin directly rather than calling
+    input(), which would initialize readline (completion setup, signal
+    handler) on first use even for piped runs.
+    """
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_CONTINUE_PROMPT)
+    sys.stdout.buffer.flush()
+    sys.stdin.readline()
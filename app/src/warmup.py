@@ -0,0 +1,32 @@
+"""Warm-up entrypoint for build-time schema construction.
+
+The settings classes use ``defer_build=True``, so their Pydantic core
+schemas are built on first instantiation rather than at import. Running
+
+    python -m src.warmup
+
+once at container/image build time imports the configuration modules
+(populating the bytecode caches) and forces the schema build and a first
+validation pass, so production starts do not pay that cost.
+"""
+
+from pydantic import ValidationError
+
+from .config import get_app_settings
+from .environment import get_app_environment
+
+
+def main() -> None:
+    """Build the settings schemas and validate the configuration once."""
+    try:
+        get_app_environment()
+        get_app_settings()
+        print("Settings warm-up complete.")
+    except ValidationError as error:
+        # The schemas are built before values are validated, so the warm-up
+        # still did its job even when the build environment lacks a token.
+        print(f"Settings schemas built; configuration incomplete:\n{error}")
+
+
+if __name__ == "__main__":
+    main()